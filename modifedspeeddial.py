@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from array import array
+from weakref import WeakSet
+
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
@@ -16,6 +19,20 @@ from kivymd.uix.behaviors import DeclarativeBehavior
 from kivymd.uix.button.button import MDFloatingBottomButton, MDFloatingLabel
 
 
+class _NullRoot:
+    """Read-only stand-in for the parent button before the dial has one."""
+
+    __slots__ = ()
+    x = 0
+    y = 0
+    pos = (0, 0)
+    center_x = 0
+    center_y = 0
+    center = (0, 0)
+    right = 0
+    top = 0
+
+
 class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
     """ModifiedSpeedDial: Modified version of :class:`kivymd.uix.button.MDFloatingActionButtonSpeedDial`
 
@@ -61,21 +78,38 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
     state = OptionProperty("close", options=("close", "open"))
 
     # Class Variables
-    _anim_buttons_data = {}
-    _anim_labels_data = {}
     _direction_vals = {'right': 1, 'top': 1,
                        'left': -1, 'bottom': -1}
-    _window = None
-    _touch_started_inside = None
-    _root_button = type('null', (), {'x': 0, 'y': 0, 'pos': (0, 0), 
-                                     'center_x': 0, 'center_y': 0, 
-                                     'center': (0, 0), 'right': 0, 
-                                     'top': 0})()
-    _buttons = []
-    _labels = []
-    _local_positions = []
+    _root_button = _NullRoot()
+
+    # Plain (non-Kivy-property) instance state lives in slots.
+    __slots__ = (
+        "_window", "_touch_started_inside", "_buttons", "_labels",
+        "_local_positions", "_label_widths", "_all_widgets",
+        "_anim_buttons_data", "_anim_labels_data", "_label_anim_active",
+        "_label_dir_sign", "_stack_dir_sign", "_trigger_update_pos",
+        "_trigger_build_stack", "_open_anim_events", "_close_binding_event",
+    )
 
     def __init__(self, **kwargs):
+        # Per-instance state is set before super().__init__ since kwargs
+        # such as ``data`` or ``label_direction`` trigger their callbacks there.
+        self._window = None
+        self._touch_started_inside = None
+        self._buttons = []
+        self._labels = []
+        self._local_positions = array('f')
+        self._label_widths = array('f')
+        self._all_widgets = []
+        self._anim_buttons_data = {}
+        self._anim_labels_data = {}
+        self._label_anim_active = WeakSet()
+        self._open_anim_events = []
+        self._close_binding_event = None
+        # Signs of the default "right" / "top" directions.
+        self._label_dir_sign = 1
+        self._stack_dir_sign = 1
+        self._trigger_build_stack = Clock.create_trigger(self._build_stack)
         super().__init__(**kwargs)
         self.size_hint = None, None
         self.size = 0, 0
@@ -84,56 +118,59 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
         self.register_event_type("on_close")
         self.register_event_type("on_press_stack_button")
         self.register_event_type("on_release_stack_button")
-        self._widget_declaration_finished = False
-        Window.bind(on_resize=self._update_pos_buttons)
-        Window.bind(on_maximize=self._update_pos_buttons)
-        Window.bind(on_restore=self._update_pos_buttons)
+        # Coalesces window events fired within one frame into a single update.
+        self._trigger_update_pos = Clock.create_trigger(self._update_pos_buttons)
+        Window.bind(on_resize=self._trigger_update_pos)
+        Window.bind(on_maximize=self._trigger_update_pos)
+        Window.bind(on_restore=self._trigger_update_pos)
         
     def on_enter(self, instance_button: MDFloatingBottomButton) -> None:
         """Called when the mouse cursor is over a button from the stack."""
-        if self.state == "open":
-            label = self._labels[self._buttons.index(instance_button)]
-            if isinstance(label, MDFloatingLabel) and self.hint_animation:
-                Animation.cancel_all(label)
+        if self.state != "open" or not self.hint_animation:
+            return
+        label = instance_button._sd_label
+        if label is not None:
+            Animation.cancel_all(label)
+            Animation(
+                _canvas_width=(-1 * (label.width + self.button_text_offset)
+                               * self._label_dir_sign),
+                d=self.opening_time,
+                t=self.opening_transition,
+            ).start(instance_button)
+            if (
+                    instance_button.icon
+                    == self.data[f"{label.text}"]
+                    or instance_button.icon
+                    == self.data[f"{label.text}"][0]
+            ):
                 Animation(
-                    _canvas_width=(-1 * (label.width + self.button_text_offset)
-                                   * self._direction_vals[self.label_direction]),
+                    opacity=1,
                     d=self.opening_time,
                     t=self.opening_transition,
-                ).start(instance_button)
-                if (
-                        instance_button.icon
-                        == self.data[f"{label.text}"]
-                        or instance_button.icon
-                        == self.data[f"{label.text}"][0]
-                ):
-                    Animation(
-                        opacity=1,
-                        d=self.opening_time,
-                        t=self.opening_transition,
-                    ).start(label)
-                else:
-                    Animation(
-                        opacity=0, d=0.1, t=self.opening_transition
-                    ).start(label)
+                ).start(label)
+            else:
+                Animation(
+                    opacity=0, d=0.1, t=self.opening_transition
+                ).start(label)
 
     def on_leave(self, instance_button: MDFloatingBottomButton) -> None:
         """Called when the mouse cursor goes outside the button of stack."""
 
-        if self.state == "open":
-            label = self._labels[self._buttons.index(instance_button)]
-            if isinstance(label, MDFloatingLabel) and self.hint_animation:
-                Animation.cancel_all(label)
-                Animation(
-                    _canvas_width=0,
-                    d=self.opening_time,
-                    t=self.opening_transition,
-                    _elevation=0,
-                ).start(instance_button)
-                Animation(
-                    opacity=0, d=0.1, t=self.opening_transition
-                ).start(label)
-                
+        if self.state != "open" or not self.hint_animation:
+            return
+        label = instance_button._sd_label
+        if label is not None:
+            Animation.cancel_all(label)
+            Animation(
+                _canvas_width=0,
+                d=self.opening_time,
+                t=self.opening_transition,
+                _elevation=0,
+            ).start(instance_button)
+            Animation(
+                opacity=0, d=0.1, t=self.opening_transition
+            ).start(label)
+
     def on_parent(self, instance_self, instance_parent):
         if hasattr(instance_parent, "on_release") and hasattr(instance_parent, "on_press"):
             self.parent.bind(on_release=self.open_stack)
@@ -144,83 +181,96 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
     def on_data(self, instance_stack_buttons, data: dict) -> None:
         """Creates a stack of buttons."""
 
-        def on_data(*args):
-            # Bottom buttons.
-            Window.bind(on_draw=self._update_pos_buttons)
-            for name, parameters in data.items():
-                name_icon = (
-                    parameters if (type(parameters) is str) else parameters[0]
-                )
-
-                bottom_button = MDFloatingBottomButton(
-                    icon=name_icon,
-                    on_enter=self.on_enter,
-                    on_leave=self.on_leave,
-                    opacity=0,
-                )
-                bottom_button.bind(
-                    on_press=lambda x: self.dispatch("on_press_stack_button"),
-                    on_release=lambda x: self.dispatch("on_release_stack_button"),
-                )
-
-                if "on_press" in parameters:
-                    callback = parameters[parameters.index("on_press") + 1]
-                    bottom_button.bind(on_press=callback)
-
-                if "on_release" in parameters:
-                    callback = parameters[parameters.index("on_release") + 1]
-                    bottom_button.bind(on_release=callback)
-                self._buttons.append(bottom_button)
-                # Labels.
-                label = None
-                floating_text = name
-                if floating_text:
-                    label = MDFloatingLabel(text=floating_text, opacity=0)
-                    label.bg_color = self.label_bg_color
-                    label.radius = self.label_radius
-                    label.text_color = (
-                        self.label_text_color
-                        if self.label_text_color
-                        else self.theme_cls.text_color
-                    )
-                self._labels.append(label)
-                self._local_positions.append(0)
-                self.set_pos_bottom_buttons(bottom_button)
-                if isinstance(label, MDFloatingLabel):
-                    self.set_pos_labels(label)
-            else:
-                self._widget_declaration_finished = True
-
         self.remove_widgets()
+        for label in self._labels:
+            if label is not None:
+                label.funbind("width", self._on_label_width)
         self._buttons = []
         self._labels = []
-        self._local_positions = []
+        self._local_positions = array('f')
+        self._label_widths = array('f')
+        self._all_widgets = []
         self._anim_buttons_data = {}
         self._anim_labels_data = {}
-        Clock.schedule_once(on_data)
-        
+        # Several changes to ``data`` within a frame build the stack once.
+        self._trigger_build_stack()
+
+    def _build_stack(self, *args) -> None:
+        # Bottom buttons.
+        for name, parameters in self.data.items():
+            name_icon = (
+                parameters if (type(parameters) is str) else parameters[0]
+            )
+
+            bottom_button = MDFloatingBottomButton(
+                icon=name_icon,
+                on_enter=self.on_enter,
+                on_leave=self.on_leave,
+                opacity=0,
+            )
+            bottom_button.fbind("on_press", self._dispatch_press)
+            bottom_button.fbind("on_release", self._dispatch_release)
+
+            if type(parameters) is not str:
+                # [icon, "on_press", callback, "on_release", callback]
+                params = iter(parameters[1:])
+                for key in params:
+                    callback = next(params, None)
+                    if key == "on_press":
+                        bottom_button.bind(on_press=callback)
+                    elif key == "on_release":
+                        bottom_button.bind(on_release=callback)
+            self._buttons.append(bottom_button)
+            self._local_positions.append(0.0)
+            # Index and paired label are kept on the button itself so the
+            # hover and positioning handlers don't have to search lists.
+            bottom_button._sd_idx = len(self._buttons) - 1
+            # Labels.
+            label = None
+            floating_text = name
+            if floating_text:
+                label = MDFloatingLabel(text=floating_text, opacity=0)
+                label.bg_color = self.label_bg_color
+                label.radius = self.label_radius
+                label.text_color = (
+                    self.label_text_color
+                    if self.label_text_color
+                    else self.theme_cls.text_color
+                )
+                label._sd_idx = bottom_button._sd_idx
+                label.fbind("width", self._on_label_width)
+            bottom_button._sd_label = label
+            self._labels.append(label)
+            self._label_widths.append(0.0 if label is None else label.width)
+            self.set_pos_bottom_buttons(bottom_button)
+            if isinstance(label, MDFloatingLabel):
+                self.set_pos_labels(label)
+        else:
+            self._all_widgets = [widget for widget in
+                                 (self._buttons + self._labels)
+                                 if widget is not None]
+            # One more pass once the new widgets have been laid out.
+            self._trigger_update_pos()
+
     def set_pos_labels(self, instance_floating_label: MDFloatingLabel) -> None:
         """
         Sets the position of the floating labels.
         Called when the application's root window is resized.
         """
-        if self._widget_declaration_finished:
-            Window.unbind(on_draw=self._update_pos_buttons)
-            self._widget_declaration_finished = False
         root = self.parent
         if root is None:
             root = self._root_button
 
         instance_floating_label.x = (root.center_x +
                                      self.button_text_offset *
-                                     self._direction_vals[self.label_direction])
-        instance_floating_label.x -= (dp(instance_floating_label.width)
-                                      if self.label_direction == 'left'
+                                     self._label_dir_sign)
+        instance_floating_label.x -= (instance_floating_label.width
+                                      if self._label_dir_sign < 0
                                       else 0)
 
         instance_floating_label.center_y = (self.parent.center_y +
                                             self._local_positions[
-                                                self._labels.index(instance_floating_label)
+                                                instance_floating_label._sd_idx
                                             ])
 
     def set_pos_bottom_buttons(
@@ -238,25 +288,32 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
         instance_floating_bottom_button.center_y = (
                 self.parent.center_y +
                 self._local_positions[
-                    self._buttons.index(instance_floating_bottom_button)
+                    instance_floating_bottom_button._sd_idx
                 ])
 
     def touch_down(self, instance_window, touch):
         """ touch down event handler. """
-        self._touch_started_inside = any([widget.collide_point(*touch.pos) 
-                                          for widget in (self._buttons+self._labels)])
+        if self.state != "open":
+            return False
+        tx, ty = touch.pos
+        self._touch_started_inside = any(widget.collide_point(tx, ty)
+                                         for widget in self._all_widgets)
         if not self.auto_dismiss or self._touch_started_inside:
             self._window.on_touch_down(touch)
         return True
     
     def touch_move(self, instance_window, touch):
         """ touch moved event handler. """
+        if self.state != "open":
+            return False
         if not self.auto_dismiss or self._touch_started_inside:
             self._window.on_touch_move(touch)
         return True
     
     def touch_up(self, instance_window, touch):
         """ touch up event handler. """
+        if self.state != "open":
+            return False
         # Explicitly test for False as None occurs when shown by on_touch_down
         if self.auto_dismiss and self._touch_started_inside is False:
             self.close_stack()
@@ -265,47 +322,60 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
         self._touch_started_inside = None
         return True
         
-    def open_binding(self, *args):
-        self._window.bind(on_touch_down=self.touch_down)
-        self._window.bind(on_touch_move=self.touch_move)
-        self._window.bind(on_touch_up=self.touch_up)
+    def bind_window(self, window) -> None:
+        """
+        Binds the touch handlers to the root window once. The handlers
+        pass touches through while the stack is closed.
+        """
+        if window is self._window:
+            return
+        if self._window is not None:
+            self._window.unbind(on_touch_down=self.touch_down,
+                                on_touch_move=self.touch_move,
+                                on_touch_up=self.touch_up)
+        window.bind(on_touch_down=self.touch_down,
+                    on_touch_move=self.touch_move,
+                    on_touch_up=self.touch_up)
+        self._window = window
 
     def close_binding(self, *args):
         self.remove_widgets()
-        self._window.unbind(on_touch_down=self.touch_down)
-        self._window.unbind(on_touch_move=self.touch_move)
-        self._window.unbind(on_touch_up=self.touch_up)
         
     def open_stack(self, instance_root_button) -> None:
-        for label in self._labels:
-            if isinstance(label, MDFloatingLabel):
-                Animation.cancel_all(label)
-
         if self.state != "open":
-            y = 30 * self._direction_vals[self.stack_button_direction]
+            if self._close_binding_event is not None:
+                self._close_binding_event.cancel()
+                self._close_binding_event = None
+            self._cancel_label_animations()
+
+            sign = self._stack_dir_sign
+            step = dp(56) * sign
+            y = 30 * sign
+            opening_time = self.opening_time
+            opening_transition = self.opening_transition
             anim_buttons_data = {}
             anim_labels_data = {}
-            self._window = self.get_root_window()
+            self.bind_window(self.get_root_window())
 
             for i, button in enumerate(self._buttons):
                 if isinstance(button, MDFloatingBottomButton):
                     # Sets new button positions.
-                    y += dp(56) * self._direction_vals[self.stack_button_direction]
+                    y += step
                     if not self._local_positions:
                         self._local_positions[i] = y
                     button.center_y += y
                     if not self._anim_buttons_data:
                         anim_buttons_data[button] = Animation(
                             opacity=1,
-                            d=self.opening_time,
-                            t=self.opening_transition,
+                            d=opening_time,
+                            t=opening_transition,
                         )
                     label = self._labels[i]
                     if isinstance(label, MDFloatingLabel):
                         label.center_y = button.center_y
                         if not self._anim_labels_data:
-                            anim_labels_data[label] = Animation(
-                                opacity=1, d=self.opening_time
+                            anim_labels_data[label] = self._label_animation(
+                                opacity=1, d=opening_time
                             )
 
             if anim_buttons_data:
@@ -333,35 +403,30 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
             }
         """
 
-        def on_progress(animation, widget, value):
-            if value >= 0.1:
-                animation_open_stack()
-
-        def animation_open_stack(*args):
-            try:
-                widget = next(widgets_list)
-                animation = anim_data[widget]
-                animation.bind(on_progress=on_progress)
+        self.add_widgets()
+        # Each animation starts a tenth of the opening time after the previous.
+        delay = 0.0
+        step = self.opening_time * 0.1
+        for widget, animation in anim_data.items():
+            if delay:
+                self._open_anim_events.append(Clock.schedule_once(
+                    lambda dt, w=widget, a=animation: a.start(w), delay
+                ))
+            else:
                 animation.start(widget)
-            except StopIteration:
-                pass
-
-        anim_root_start = Animation(size=self._window.size, 
-                              d=self.opening_time)
-        anim_root_start.bind(on_start=lambda x, y: self.add_widgets())
-        anim_root_start.bind(on_complete=self.open_binding)
-        anim_root_start.start(self._window)
-        widgets_list = iter(list(anim_data.keys()))
-        animation_open_stack()
+            delay += step
 
     def close_stack(self):
         """Closes the button stack."""
 
-        anim_root_end = Animation(size=self._window.size, 
-                                      d=self.closing_time+0.1)
-        anim_root_end.start(self._window)
-        anim_root_end.bind(on_complete=self.close_binding)
-        
+        for event in self._open_anim_events:
+            event.cancel()
+        self._open_anim_events = []
+        self._close_binding_event = Clock.schedule_once(
+            self.close_binding, self.closing_time + 0.1
+        )
+        self._cancel_label_animations()
+
         for button, label in zip(self._buttons, self._labels):
             if isinstance(button, MDFloatingBottomButton):
                 Animation(
@@ -372,6 +437,7 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
                 ).start(button)
             if isinstance(label, MDFloatingLabel):
                 if label.opacity > 0:
+                    Animation.cancel_all(label)
                     Animation(opacity=0, d=0.01).start(label)
 
         self.disabled = True
@@ -404,11 +470,52 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
 
     def _update_pos_buttons(self, instance=None, width=None, height=None):
         # Updates button positions when resizing screen.
-        for widget in (self._buttons + self._labels):
-            if isinstance(widget, MDFloatingBottomButton):
-                self.set_pos_bottom_buttons(widget)
-            elif isinstance(widget, MDFloatingLabel):
-                self.set_pos_labels(widget)
+        root = self.parent
+        if root is None:
+            root = self._root_button
+        center_x, center_y = root.center_x, root.center_y
+        label_x = (center_x + self.button_text_offset *
+                   self._label_dir_sign)
+        left = self._label_dir_sign < 0
+
+        for button, label, local_y, label_width in zip(
+                self._buttons, self._labels,
+                self._local_positions, self._label_widths):
+            y = center_y + local_y
+            button.center_x = center_x
+            button.center_y = y
+            if label is None:
+                continue
+            label.x = label_x - label_width if left else label_x
+            label.center_y = y
+
+    def _on_label_width(self, instance_floating_label, width) -> None:
+        self._label_widths[instance_floating_label._sd_idx] = width
+        if self._label_dir_sign < 0:
+            self._trigger_update_pos()
+
+    def _label_animation(self, **kwargs) -> Animation:
+        # Creates an opening fade-in for a label that keeps track of the
+        # labels it runs on, so that opening and closing the stack only
+        # cancel fade-ins that are in progress. Hover animations don't use it.
+        animation = Animation(**kwargs)
+        animation.bind(
+            on_start=self._on_label_animation_start,
+            on_complete=self._on_label_animation_end,
+            on_cancel=self._on_label_animation_end,
+        )
+        return animation
+
+    def _on_label_animation_start(self, animation, label):
+        self._label_anim_active.add(label)
+
+    def _on_label_animation_end(self, animation, label):
+        self._label_anim_active.discard(label)
+
+    def _cancel_label_animations(self):
+        # Cancelling fires on_cancel, which discards from the set.
+        for label in list(self._label_anim_active):
+            Animation.cancel_all(label)
 
     def _set_button_property(
             self, instance, property_name: str, property_value: str | list
@@ -424,11 +531,13 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
         Clock.schedule_interval(set_count_widget, 0)
 
     def on_label_direction(self, *args):
+        self._label_dir_sign = self._direction_vals[self.label_direction]
         for label in self._labels:
             if isinstance(label, MDFloatingLabel):
                 self.set_pos_labels(label)
 
     def on_stack_button_direction(self, *args):
+        self._stack_dir_sign = self._direction_vals[self.stack_button_direction]
         for button in self._buttons:
             if isinstance(button, MDFloatingBottomButton):
                 self.set_pos_bottom_buttons(button)
@@ -452,6 +561,12 @@ class ModifiedSpeedDial(DeclarativeBehavior, ThemableBehavior, Widget):
     def on_bg_color_stack_button(self, instance_speed_dial, color: list) -> None:
         self._set_button_property(MDFloatingBottomButton, "md_bg_color", color)
 
+    def _dispatch_press(self, *args):
+        self.dispatch("on_press_stack_button")
+
+    def _dispatch_release(self, *args):
+        self.dispatch("on_release_stack_button")
+
     def on_open(self, *args):
         """Called when a stack is opened."""
 